@@ -1,13 +1,28 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+import numpy as np
 import pandas as pd
-from langchain.agents import Tool, AgentExecutor, LLMSingleActionAgent
-from langchain.prompts import StringPromptTemplate
-from langchain.chains import LLMChain
+from langchain.agents import Tool, AgentExecutor
+from langchain.agents.format_scratchpad import format_log_to_str
+from langchain.agents.output_parsers import ReActSingleInputOutputParser
+from langchain.prompts import ChatPromptTemplate
 from langchain.memory import ConversationBufferMemory
-from langchain_openai import OpenAI
+from langchain.schema import SystemMessage
+from langchain.schema.runnable import RunnablePassthrough
+from langchain_openai import ChatOpenAI
 from langchain.tools import BaseTool
+from langchain.tools.render import render_text_description
+from collections import OrderedDict
+import hashlib
+import logging
 import os
 from dotenv import load_dotenv
+from agent.response_cache import ResponseCache
+from utils.data_loader import DataLoader
+
+logger = logging.getLogger(__name__)
+
+# Number of parsed datasets kept in memory (least recently used are dropped)
+MAX_CACHED_FRAMES = 8
 
 # Load environment variables
 load_dotenv()
@@ -24,18 +39,27 @@ class DataAnalysisTool(BaseTool):
         """Run the data analysis tool."""
         try:
             # Basic statistical analysis
-            numeric_cols = data.select_dtypes(include=['int64', 'float64']).columns
+            numeric_cols = data.select_dtypes(include='number', exclude='timedelta').columns
             stats = data[numeric_cols].describe()
             
-            # Correlation analysis
-            correlations = data[numeric_cols].corr()
+            # Correlation analysis as a single matrix product over the centered block
+            values = data[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            if np.isnan(values).any():
+                # Missing values need pandas' pairwise-complete correlation
+                correlations = data[numeric_cols].corr()
+            else:
+                centered = values - values.mean(axis=0)
+                cov = centered.T @ centered
+                norms = np.sqrt(np.diag(cov))
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    corr = np.clip(cov / np.outer(norms, norms), -1.0, 1.0)
+                correlations = pd.DataFrame(corr, index=numeric_cols, columns=numeric_cols)
             
-            # Basic insights
-            insights = []
-            for col in numeric_cols:
-                mean_val = data[col].mean()
-                std_val = data[col].std()
-                insights.append(f"{col}: Mean={mean_val:.2f}, Std={std_val:.2f}")
+            # Basic insights, reusing the mean/std already in stats
+            insights = [
+                f"{col}: Mean={stats.loc['mean', col]:.2f}, Std={stats.loc['std', col]:.2f}"
+                for col in numeric_cols
+            ]
             
             return f"Analysis Results:\n{stats}\n\nCorrelations:\n{correlations}\n\nInsights:\n" + "\n".join(insights)
         except Exception as e:
@@ -43,13 +67,15 @@ class DataAnalysisTool(BaseTool):
 
 class DataAgent:
     def __init__(self):
-        self.llm = OpenAI(temperature=0)
+        self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, max_retries=3)
         self.memory = ConversationBufferMemory(memory_key="chat_history")
+        self.cache = ResponseCache()
+        self._df_cache: "OrderedDict[str, Tuple[float, pd.DataFrame]]" = OrderedDict()
         self.tools = [
             DataAnalysisTool(),
             Tool(
                 name="data_summary",
-                func=lambda x: str(pd.read_csv(x).describe()),
+                func=lambda x: str(self._load(x).describe()),
                 description="Provides a summary of the dataset"
             )
         ]
@@ -58,52 +84,85 @@ class DataAgent:
     
     def _create_agent(self) -> AgentExecutor:
         """Create the LangChain agent with tools and memory."""
-        prompt = StringPromptTemplate.from_template(
-            """You are a data analysis assistant. Use the following tools to help analyze data:
-            
-            {tools}
-            
-            Use the following format:
-            Question: the input question you must answer
-            Thought: you should always think about what to do
-            Action: the action to take, should be one of [{tool_names}]
-            Action Input: the input to the action
-            Observation: the result of the action
-            ... (this Thought/Action/Action Input/Observation can repeat N times)
-            Thought: I now know the final answer
-            Final Answer: the final answer to the original input question
-            
-            Begin!
-            
-            Question: {input}
-            {agent_scratchpad}"""
-        )
+        # The tools never change, so render the system message once. Everything
+        # that varies per turn goes in the human message, so every call shares a
+        # byte-identical prefix that OpenAI's automatic prompt caching can reuse
+        system_prompt = f"""You are a data analysis assistant. Use the following tools to help analyze data:
+
+{render_text_description(self.tools)}
+
+Use the following format:
+Question: the input question you must answer
+Thought: you should always think about what to do
+Action: the action to take, should be one of [{", ".join(tool.name for tool in self.tools)}]
+Action Input: the input to the action
+Observation: the result of the action
+... (this Thought/Action/Action Input/Observation can repeat N times)
+Thought: I now know the final answer
+Final Answer: the final answer to the original input question"""
+        self.prompt_prefix_hash = hashlib.sha256(system_prompt.encode()).hexdigest()
+        logger.info("Agent system prompt sha256: %s", self.prompt_prefix_hash)
         
-        llm_chain = LLMChain(llm=self.llm, prompt=prompt)
+        prompt = ChatPromptTemplate.from_messages([
+            SystemMessage(content=system_prompt),
+            ("human", """Previous conversation:
+{chat_history}
+
+Begin!
+
+Question: {input}
+{agent_scratchpad}"""),
+        ])
         
-        agent = LLMSingleActionAgent(
-            llm_chain=llm_chain,
-            allowed_tools=[tool.name for tool in self.tools],
-            stop=["\nObservation:"],
-            memory=self.memory
+        agent = (
+            RunnablePassthrough.assign(
+                agent_scratchpad=lambda x: format_log_to_str(x["intermediate_steps"])
+            )
+            | prompt
+            | self.llm.bind(stop=["\nObservation"])
+            | ReActSingleInputOutputParser()
         )
         
-        return AgentExecutor.from_agent_and_tools(
+        return AgentExecutor(
             agent=agent,
             tools=self.tools,
             memory=self.memory,
+            handle_parsing_errors=True,
             verbose=True
         )
     
-    def analyze(self, query: str, data_path: str = None) -> str:
+    def _load(self, path: str) -> pd.DataFrame:
+        """Load a data file, reusing the parsed DataFrame while the file is unchanged."""
+        mtime = os.stat(path).st_mtime
+        cached = self._df_cache.get(path)
+        if cached and cached[0] == mtime:
+            self._df_cache.move_to_end(path)
+            return cached[1]
+        
+        data = DataLoader.load_data(path)
+        self._df_cache[path] = (mtime, data)
+        self._df_cache.move_to_end(path)
+        while len(self._df_cache) > MAX_CACHED_FRAMES:
+            self._df_cache.popitem(last=False)
+        return data
+    
+    def analyze(self, query: str, data_path: str = None, conversation_id: str = '') -> str:
         """Analyze data based on the user's query."""
         try:
+            # Repeated questions against the same data in the same chat skip the LLM round-trip
+            cache_key = self.cache.key(query, data_path, conversation_id)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.memory.save_context({"input": query}, {"output": cached})
+                return cached
+            
             if data_path:
-                data = pd.read_csv(data_path)
+                data = self._load(data_path)
                 # Add data to the agent's context
                 self.agent.memory.chat_memory.add_user_message(f"Data loaded from {data_path}")
             
-            response = self.agent.run(query)
+            response = self.agent.invoke({"input": query})["output"]
+            self.cache.put(cache_key, response)
             return response
         except Exception as e:
             return f"Error in analysis: {str(e)}"
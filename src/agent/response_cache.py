@@ -0,0 +1,90 @@
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """In-memory cache of agent answers keyed on (dataset content, conversation id, normalized question)."""
+
+    def __init__(self, ttl: float = 3600.0, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl (float): Seconds an answer stays valid after it is stored
+            max_entries (int): Maximum number of answers kept (least recently used are evicted)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[float, str]]" = OrderedDict()
+        self._digests: Dict[str, Tuple[float, int, str]] = {}
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalize a question so trivially different phrasings share a key."""
+        return ' '.join(query.lower().split()).rstrip('?!. ')
+
+    def dataset_digest(self, data_path: Optional[str]) -> str:
+        """
+        Hash the dataset contents, memoized on the file's mtime and size.
+
+        Args:
+            data_path (Optional[str]): Path to the data file
+
+        Returns:
+            str: Hex digest of the file contents (empty string when no file is given)
+        """
+        if not data_path:
+            return ''
+
+        stat = os.stat(data_path)
+        cached = self._digests.get(data_path)
+        if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+            return cached[2]
+
+        digest = hashlib.blake2b(digest_size=16)
+        with open(data_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+
+        hexdigest = digest.hexdigest()
+        self._digests[data_path] = (stat.st_mtime, stat.st_size, hexdigest)
+        return hexdigest
+
+    def key(self, query: str, data_path: Optional[str] = None, conversation_id: str = '') -> Tuple[str, str, str]:
+        """
+        Build the cache key for a question against a dataset.
+
+        Args:
+            query (str): The user's question
+            data_path (Optional[str]): Path to the data file
+            conversation_id (str): Chat the question was asked in; follow-up
+                questions only match answers given in the same chat
+
+        Returns:
+            Tuple[str, str, str]: Dataset digest, conversation id and normalized question
+        """
+        return self.dataset_digest(data_path), conversation_id, self.normalize(query)
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[str]:
+        """Return the cached answer for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: Tuple[str, str, str], response: str) -> None:
+        """Store an answer, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
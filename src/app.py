@@ -1,6 +1,11 @@
 from flask import Flask, request, render_template_string, session, redirect, url_for
 from werkzeug.utils import secure_filename
+from collections import OrderedDict, deque
+import hashlib
 import os
+import uuid
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
 from agent.data_agent import DataAgent
 
 app = Flask(__name__)
@@ -8,10 +13,28 @@ app.secret_key = 'supersecretkey'  # Change this in production
 UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), 'uploads')
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+CHUNK_SIZE = 1 << 20  # Read uploads in 1MB chunks
 
 # Store agent in global scope for simplicity
 agent = DataAgent()
 
+# Chat histories live server-side; the session cookie only carries a chat_id
+MAX_CHAT_HISTORY = 50
+MAX_CHATS = 1000
+chats = OrderedDict()
+
+def get_chat() -> deque:
+    """Return the current session's chat history, creating it if needed."""
+    chat_id = session.get('chat_id')
+    if chat_id not in chats:
+        chat_id = uuid.uuid4().hex
+        session['chat_id'] = chat_id
+        chats[chat_id] = deque(maxlen=MAX_CHAT_HISTORY)
+        if len(chats) > MAX_CHATS:
+            chats.popitem(last=False)
+    chats.move_to_end(chat_id)
+    return chats[chat_id]
+
 template = '''
 <!DOCTYPE html>
 <html lang="en">
@@ -58,20 +81,17 @@ template = '''
 
 @app.route('/', methods=['GET', 'POST'])
 def index():
-    if 'chat' not in session:
-        session['chat'] = []
     data_path = session.get('data_path')
-    chat = session['chat']
+    chat = get_chat()
     if request.method == 'POST':
         question = request.form.get('question')
         if question:
             if data_path:
-                answer = agent.analyze(question, data_path)
+                answer = agent.analyze(question, data_path, session['chat_id'])
             else:
                 answer = "Please upload a CSV file first."
             chat.append({'user': question, 'assistant': answer})
-            session['chat'] = chat
-    return render_template_string(template, chat=chat, data_path=os.path.basename(data_path) if data_path else None)
+    return render_template_string(template, chat=chat, data_path=session.get('data_name') if data_path else None)
 
 @app.route('/upload', methods=['POST'])
 def upload():
@@ -81,10 +101,37 @@ def upload():
     if file.filename == '':
         return redirect(url_for('index'))
     filename = secure_filename(file.filename)
-    filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    file.save(filepath)
+    
+    # Name the parsed file by content hash so re-uploads skip parsing entirely
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: file.stream.read(CHUNK_SIZE), b''):
+        digest.update(chunk)
+    file.stream.seek(0)
+    filepath = os.path.join(app.config['UPLOAD_FOLDER'], f"{digest.hexdigest()}.arrow")
+    
+    chat = get_chat()
+    if not os.path.exists(filepath):
+        # Parse the upload stream once and store it as uncompressed Arrow IPC,
+        # which later requests memory-map instead of re-parsing the CSV
+        try:
+            table = pacsv.read_csv(file.stream)
+        except Exception as e:
+            # Keep the current conversation; the previous dataset is still loaded
+            chat.append({'user': f"Upload {filename}", 'assistant': f"Error reading CSV: {str(e)}"})
+            return redirect(url_for('index'))
+        tmp_path = f"{filepath}.tmp"
+        try:
+            feather.write_feather(table, tmp_path, compression='uncompressed')
+            os.replace(tmp_path, filepath)
+        except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            chat.append({'user': f"Upload {filename}", 'assistant': f"Error saving data: {str(e)}"})
+            return redirect(url_for('index'))
+    
+    chat.clear()  # Reset chat on new upload
     session['data_path'] = filepath
-    session['chat'] = []  # Reset chat on new upload
+    session['data_name'] = filename
     return redirect(url_for('index'))
 
 if __name__ == '__main__':
@@ -1,8 +1,12 @@
 import pandas as pd
 import numpy as np
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
 
 class DataLoader:
     """Utility class for loading and processing different types of data files."""
@@ -10,7 +14,10 @@ class DataLoader:
     @staticmethod
     def load_data(file_path: str) -> pd.DataFrame:
         """
-        Load data from various file formats (CSV, JSON, Excel).
+        Load data from various file formats (CSV, JSON, Excel, Parquet, Arrow IPC).
+        
+        Columns are backed by pyarrow dtypes. For data that is loaded
+        repeatedly, converting it to Parquet once is much faster to re-read.
         
         Args:
             file_path (str): Path to the data file
@@ -29,16 +36,62 @@ class DataLoader:
         
         try:
             if file_ext == '.csv':
-                return pd.read_csv(file_path)
+                return pd.read_csv(file_path, engine='pyarrow', dtype_backend='pyarrow')
             elif file_ext == '.json':
-                return pd.read_json(file_path)
+                return pd.read_json(file_path, dtype_backend='pyarrow')
             elif file_ext in ['.xlsx', '.xls']:
-                return pd.read_excel(file_path)
+                return pd.read_excel(file_path, dtype_backend='pyarrow')
+            elif file_ext == '.parquet':
+                return pd.read_parquet(file_path, engine='pyarrow', dtype_backend='pyarrow')
+            elif file_ext in ['.arrow', '.feather']:
+                # Memory-mapped, so uncompressed files load without copying buffers
+                table = feather.read_table(file_path, memory_map=True)
+                return table.to_pandas(types_mapper=pd.ArrowDtype)
             else:
                 raise ValueError(f"Unsupported file format: {file_ext}")
         except Exception as e:
             raise Exception(f"Error loading file {file_path}: {str(e)}")
     
+    @staticmethod
+    def _categorical_columns(df: pd.DataFrame) -> pd.Index:
+        """Return the non-numeric columns (strings, booleans, dates and timestamps)."""
+        # pyarrow-backed loads give these their own dtypes where NumPy loads used object
+        return df.select_dtypes(exclude=[np.number]).columns
+    
+    @staticmethod
+    def _string_array(col: pd.Series) -> Optional[pa.Array]:
+        """Return the column as an Arrow string array, or None if it holds non-string values."""
+        try:
+            arr = pa.array(col, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return None
+        if pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type):
+            return arr
+        return None
+    
+    @staticmethod
+    def _column_mode(col: pd.Series) -> Any:
+        """Most frequent non-null value (smallest on ties, like Series.mode), NaN if none."""
+        arr = DataLoader._string_array(col)
+        if arr is None:
+            modes = col.mode()
+            return modes.iloc[0] if len(modes) else np.nan
+        
+        # Arrow's hash kernel counts strings in C++; pc.mode only supports numbers
+        value_counts = pc.value_counts(pc.drop_null(arr))
+        if len(value_counts) == 0:
+            return np.nan
+        counts = value_counts.field('counts')
+        return pc.min(value_counts.field('values').filter(pc.equal(counts, pc.max(counts)))).as_py()
+    
+    @staticmethod
+    def _column_nunique(col: pd.Series) -> int:
+        """Number of distinct non-null values in the column."""
+        arr = DataLoader._string_array(col)
+        if arr is None:
+            return col.nunique()
+        return pc.count_distinct(arr).as_py()
+    
     @staticmethod
     def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -55,15 +108,32 @@ class DataLoader:
         
         # Handle missing values
         numeric_cols = df_processed.select_dtypes(include=[np.number]).columns
-        categorical_cols = df_processed.select_dtypes(include=['object']).columns
+        categorical_cols = DataLoader._categorical_columns(df_processed)
+        
+        # Fill values are independent per column, and both NumPy reductions and
+        # Arrow kernels release the GIL, so compute them on a thread pool
+        with ThreadPoolExecutor() as pool:
+            # Fill numeric missing values with median
+            medians = pool.map(lambda col: df_processed[col].median(), numeric_cols)
+            
+            # Fill categorical missing values with mode
+            modes = pool.map(lambda col: DataLoader._column_mode(df_processed[col]), categorical_cols)
+            
+            fill_values = dict(zip(numeric_cols, medians))
+            fill_values.update(zip(categorical_cols, modes))
         
-        # Fill numeric missing values with median
-        for col in numeric_cols:
-            df_processed[col].fillna(df_processed[col].median(), inplace=True)
+        # Nullable integer columns (pyarrow or Int64) would truncate or reject
+        # a fractional median, so widen the ones that have gaps to float first
+        for col, value in fill_values.items():
+            dtype = df_processed[col].dtype
+            if (pd.api.types.is_integer_dtype(dtype) and not isinstance(dtype, np.dtype)
+                    and pd.notna(value) and not float(value).is_integer()
+                    and df_processed[col].hasnans):
+                float_dtype = pd.ArrowDtype(pa.float64()) if isinstance(dtype, pd.ArrowDtype) else 'Float64'
+                df_processed[col] = df_processed[col].astype(float_dtype)
         
-        # Fill categorical missing values with mode
-        for col in categorical_cols:
-            df_processed[col].fillna(df_processed[col].mode()[0], inplace=True)
+        # Fill every column in one pass on the copy
+        df_processed.fillna(fill_values, inplace=True)
         
         return df_processed
     
@@ -84,7 +154,7 @@ class DataLoader:
             'dtypes': df.dtypes.to_dict(),
             'missing_values': df.isnull().sum().to_dict(),
             'numeric_columns': list(df.select_dtypes(include=[np.number]).columns),
-            'categorical_columns': list(df.select_dtypes(include=['object']).columns),
+            'categorical_columns': list(DataLoader._categorical_columns(df)),
             'memory_usage': df.memory_usage(deep=True).sum()
         }
         
@@ -120,18 +190,21 @@ class DataLoader:
         Returns:
             Dict[str, Any]: Dictionary containing validation results
         """
+        # Scan for nulls and distinct counts once and derive every check from them
+        null_any = df.isnull().any().to_numpy()
+        is_categorical = df.columns.isin(DataLoader._categorical_columns(df))
+        nunique = np.array([
+            DataLoader._column_nunique(col) if categorical else col.nunique()
+            for (_, col), categorical in zip(df.items(), is_categorical)
+        ], dtype=np.int64)
+        
         validation = {
-            'has_missing_values': df.isnull().any().any(),
-            'missing_value_columns': df.columns[df.isnull().any()].tolist(),
+            'has_missing_values': null_any.any(),
+            'missing_value_columns': df.columns[null_any].tolist(),
             'duplicate_rows': df.duplicated().sum(),
-            'zero_variance_columns': df.columns[df.nunique() == 1].tolist(),
-            'high_cardinality_columns': []
+            'zero_variance_columns': df.columns[nunique == 1].tolist(),
+            # Categorical columns with more than 50% unique values
+            'high_cardinality_columns': df.columns[is_categorical & (nunique > df.shape[0] * 0.5)].tolist()
         }
         
-        # Check for high cardinality in categorical columns
-        categorical_cols = df.select_dtypes(include=['object']).columns
-        for col in categorical_cols:
-            if df[col].nunique() > df.shape[0] * 0.5:  # More than 50% unique values
-                validation['high_cardinality_columns'].append(col)
-        
         return validation 
\ No newline at end of file
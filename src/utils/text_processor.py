@@ -1,11 +1,37 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+import heapq
+import itertools
 import re
-from collections import Counter
+import zlib
+from functools import lru_cache
 import nltk
-from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# MinHash parameters: number of hash permutations and the Mersenne prime they are taken modulo
+MINHASH_PERMUTATIONS = 128
+MINHASH_PRIME = (1 << 31) - 1
+
+# Cleaning keeps lowercase letters and whitespace. ASCII text takes the
+# str.translate fast path; the compiled regex handles everything else.
+NON_ALPHA_PATTERN = re.compile(r'[^a-z\s]+')
+ASCII_NON_ALPHA_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if not (c.islower() or c.isspace())))
+
+# Contractions that word_tokenize's Treebank rules split even without an
+# apostrophe, i.e. the ones that survive preprocess_text
+CONTRACTION_SPLITS = {
+    'cannot': ('can', 'not'),
+    'gimme': ('gim', 'me'),
+    'gonna': ('gon', 'na'),
+    'gotta': ('got', 'ta'),
+    'lemme': ('lem', 'me'),
+    'wanna': ('wan', 'na'),
+}
 
 class TextProcessor:
     """Utility class for processing and analyzing text data."""
@@ -14,15 +40,37 @@ class TextProcessor:
         """Initialize the text processor with required NLTK resources."""
         try:
             nltk.data.find('tokenizers/punkt')
+            nltk.data.find('tokenizers/punkt_tab')
             nltk.data.find('corpora/stopwords')
             nltk.data.find('corpora/wordnet')
         except LookupError:
             nltk.download('punkt')
+            nltk.download('punkt_tab')
             nltk.download('stopwords')
             nltk.download('wordnet')
         
         self.stop_words = set(stopwords.words('english'))
         self.lemmatizer = WordNetLemmatizer()
+        
+        # WordNet lookups are slow; memoize them since vocabularies repeat heavily
+        self._lemmatize = lru_cache(maxsize=100_000)(self.lemmatizer.lemmatize)
+        
+        # Random linear hashes (a * h + b) % prime for MinHash signatures
+        rng = np.random.default_rng(0)
+        self._minhash_a = rng.integers(1, MINHASH_PRIME, size=(MINHASH_PERMUTATIONS, 1), dtype=np.uint64)
+        self._minhash_b = rng.integers(0, MINHASH_PRIME, size=(MINHASH_PERMUTATIONS, 1), dtype=np.uint64)
+        
+        # Signatures are memoized so repeated comparisons skip tokenization
+        self._signature = lru_cache(maxsize=4096)(self._minhash)
+        
+        # WordNet and the punkt model load lazily on first use, which takes
+        # seconds; pay that here instead of on the first real request. A model
+        # that is still missing only fails the methods that need it.
+        try:
+            self._lemmatize('warmup')
+            nltk.sent_tokenize('Warm up.')
+        except LookupError:
+            pass
     
     def preprocess_text(self, text: str) -> str:
         """
@@ -38,7 +86,10 @@ class TextProcessor:
         text = text.lower()
         
         # Remove special characters and digits
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
+        if text.isascii():
+            text = text.translate(ASCII_NON_ALPHA_TABLE)
+        else:
+            text = NON_ALPHA_PATTERN.sub('', text)
         
         # Remove extra whitespace
         text = ' '.join(text.split())
@@ -58,11 +109,13 @@ class TextProcessor:
         # Preprocess text
         text = self.preprocess_text(text)
         
-        # Tokenize
-        tokens = word_tokenize(text)
+        # Tokenize: preprocessing leaves only letters separated by single
+        # spaces, so a plain split plus word_tokenize's contraction rules
+        # gives the same tokens at a fraction of the cost
+        tokens = [part for token in text.split() for part in CONTRACTION_SPLITS.get(token, (token,))]
         
         # Remove stopwords and lemmatize
-        tokens = [self.lemmatizer.lemmatize(token) for token in tokens 
+        tokens = [self._lemmatize(token) for token in tokens 
                  if token not in self.stop_words]
         
         return tokens
@@ -77,8 +130,46 @@ class TextProcessor:
         Returns:
             Dict[str, int]: Dictionary of word frequencies
         """
-        tokens = self.tokenize_text(text)
-        return dict(Counter(tokens))
+        words, counts = self._count_tokens(self.tokenize_text(text))
+        return dict(zip(words.tolist(), counts.tolist()))
+    
+    @staticmethod
+    def _count_tokens(tokens: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Count token occurrences without building a Python dict.
+        
+        Args:
+            tokens (List[str]): Input tokens
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Unique words in first-seen order and their counts
+        """
+        codes, words = pd.factorize(np.asarray(tokens, dtype=object))
+        return np.asarray(words, dtype=object), np.bincount(codes, minlength=len(words))
+    
+    @staticmethod
+    def _top_n(words: np.ndarray, counts: np.ndarray, top_n: int) -> List[Tuple[str, int]]:
+        """
+        Select the most frequent words in linear time instead of sorting all of them.
+        
+        Args:
+            words (np.ndarray): Unique words in first-seen order
+            counts (np.ndarray): Count of each word
+            top_n (int): Number of words to return
+            
+        Returns:
+            List[Tuple[str, int]]: (word, count) pairs by descending count, ties in first-seen order
+        """
+        if top_n <= 0 or len(counts) == 0:
+            return []
+        
+        # Keep every word tying with the top_n-th count, then order just those candidates
+        kth = min(top_n, len(counts)) - 1
+        threshold = -np.partition(-counts, kth)[kth]
+        candidates = np.flatnonzero(counts >= threshold)
+        candidates = candidates[np.lexsort((candidates, -counts[candidates]))][:top_n]
+        
+        return [(words[i], int(counts[i])) for i in candidates]
     
     def analyze_text_column(self, df: pd.DataFrame, column: str) -> Dict[str, Any]:
         """
@@ -94,26 +185,45 @@ class TextProcessor:
         if column not in df.columns:
             raise ValueError(f"Column {column} not found in DataFrame")
         
-        # Combine all text
-        all_text = ' '.join(df[column].astype(str))
+        # Clean, split and count each row with Arrow string kernels instead of
+        # joining the whole column into one Python string. RE2's \s only covers
+        # [\t\n\f\r ], so the class adds the rest of what Python's \s matches
+        # (\v, \x1c-\x1f, \x85 and Unicode spaces) to split words identically.
+        texts = pa.array(df[column].astype('string[pyarrow]'))
+        cleaned = pc.replace_substring_regex(pc.utf8_lower(texts), r'[^a-z\s\x{0b}\x{1c}-\x{1f}\x{85}\p{Z}]', '')
+        token_counts = pc.value_counts(pc.list_flatten(pc.utf8_split_whitespace(cleaned)))
+        raw_words = token_counts.field('values').to_numpy(zero_copy_only=False)
+        raw_counts = token_counts.field('counts').to_numpy()
+        
+        # Split contractions the way tokenize_text does; each part keeps the word's count
+        parts = [CONTRACTION_SPLITS.get(word, (word,)) for word in raw_words]
+        if any(len(part) > 1 for part in parts):
+            raw_counts = np.repeat(raw_counts, [len(part) for part in parts])
+            raw_words = np.array(list(itertools.chain.from_iterable(parts)), dtype=object)
+        
+        # Stopword filtering and lemmatization only run once per distinct token
+        keep = np.fromiter((word != '' and word not in self.stop_words for word in raw_words),
+                           dtype=bool, count=len(raw_words))
+        lemmas = [self._lemmatize(word) for word in raw_words[keep]]
+        word_counts = pd.Series(raw_counts[keep], index=lemmas, dtype=np.int64).groupby(level=0, sort=False).sum()
         
         # Get word frequencies
-        word_freq = self.get_word_frequencies(all_text)
+        words, counts = word_counts.index.to_numpy(dtype=object), word_counts.to_numpy()
         
         # Calculate basic statistics
-        total_words = sum(word_freq.values())
-        unique_words = len(word_freq)
+        total_words = int(counts.sum())
+        unique_words = len(words)
         
         # Get most common words
-        most_common = dict(sorted(word_freq.items(), 
-                                key=lambda x: x[1], 
-                                reverse=True)[:10])
+        most_common = dict(self._top_n(words, counts, 10))
+        
+        word_lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
         
         return {
             'total_words': total_words,
             'unique_words': unique_words,
             'most_common_words': most_common,
-            'average_word_length': sum(len(word) * freq for word, freq in word_freq.items()) / total_words
+            'average_word_length': int((word_lengths * counts).sum()) / total_words if total_words else 0.0
         }
     
     def extract_keywords(self, text: str, top_n: int = 10) -> List[str]:
@@ -127,14 +237,38 @@ class TextProcessor:
         Returns:
             List[str]: List of keywords
         """
-        word_freq = self.get_word_frequencies(text)
-        return [word for word, _ in sorted(word_freq.items(), 
-                                         key=lambda x: x[1], 
-                                         reverse=True)[:top_n]]
+        words, counts = self._count_tokens(self.tokenize_text(text))
+        return [word for word, _ in self._top_n(words, counts, top_n)]
+    
+    def _minhash(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a text's token set.
+        
+        Args:
+            text (str): Input text
+            
+        Returns:
+            np.ndarray: Signature of MINHASH_PERMUTATIONS values, empty if the text has no tokens
+        """
+        tokens = set(self.tokenize_text(text))
+        if not tokens:
+            return np.empty(0, dtype=np.uint64)
+        
+        hashes = np.fromiter((zlib.crc32(token.encode()) for token in tokens),
+                             dtype=np.uint64, count=len(tokens))
+        
+        # Take the per-permutation minimum in chunks to bound the (k, n) intermediate
+        signature = np.full(MINHASH_PERMUTATIONS, MINHASH_PRIME, dtype=np.uint64)
+        for start in range(0, len(hashes), 4096):
+            chunk = hashes[start:start + 4096]
+            permuted = (self._minhash_a * chunk + self._minhash_b) % MINHASH_PRIME
+            np.minimum(signature, permuted.min(axis=1), out=signature)
+        
+        return signature
     
     def get_text_similarity(self, text1: str, text2: str) -> float:
         """
-        Calculate similarity between two texts using Jaccard similarity.
+        Estimate the Jaccard similarity between two texts using MinHash signatures.
         
         Args:
             text1 (str): First text
@@ -143,15 +277,14 @@ class TextProcessor:
         Returns:
             float: Similarity score between 0 and 1
         """
-        # Tokenize texts
-        tokens1 = set(self.tokenize_text(text1))
-        tokens2 = set(self.tokenize_text(text2))
+        sig1 = self._signature(text1)
+        sig2 = self._signature(text2)
         
-        # Calculate Jaccard similarity
-        intersection = len(tokens1.intersection(tokens2))
-        union = len(tokens1.union(tokens2))
+        if sig1.size == 0 or sig2.size == 0:
+            return 0.0
         
-        return intersection / union if union > 0 else 0.0
+        # The fraction of matching minimums is an unbiased Jaccard estimate
+        return float(np.mean(sig1 == sig2))
     
     def generate_text_summary(self, text: str, max_length: int = 200) -> str:
         """
@@ -164,29 +297,32 @@ class TextProcessor:
         Returns:
             str: Text summary
         """
-        # Tokenize and get word frequencies
-        tokens = self.tokenize_text(text)
-        word_freq = Counter(tokens)
+        # Tokenize each sentence once; the document's word frequencies are
+        # the counts over all sentence tokens combined
+        sentences = nltk.sent_tokenize(text)
+        sentence_tokens = [self.tokenize_text(sentence) for sentence in sentences]
+        words, counts = self._count_tokens(list(itertools.chain.from_iterable(sentence_tokens)))
+        word_freq = dict(zip(words.tolist(), counts.tolist()))
         
         # Score sentences based on word frequencies
-        sentences = nltk.sent_tokenize(text)
         sentence_scores = {}
         
-        for sentence in sentences:
-            sentence_tokens = self.tokenize_text(sentence)
-            score = sum(word_freq[token] for token in sentence_tokens)
-            sentence_scores[sentence] = score
+        for sentence, tokens in zip(sentences, sentence_tokens):
+            if sentence not in sentence_scores:
+                sentence_scores[sentence] = sum(word_freq[token] for token in tokens)
         
-        # Select top sentences
-        top_sentences = sorted(sentence_scores.items(), 
-                             key=lambda x: x[1], 
-                             reverse=True)
+        # Pop top sentences lazily from a heap (ties in document order) rather
+        # than sorting all of them, since selection usually stops early
+        top_sentences = [(-score, position, sentence)
+                         for position, (sentence, score) in enumerate(sentence_scores.items())]
+        heapq.heapify(top_sentences)
         
         # Generate summary
         summary = []
         current_length = 0
         
-        for sentence, _ in top_sentences:
+        while top_sentences:
+            _, _, sentence = heapq.heappop(top_sentences)
             if current_length + len(sentence) <= max_length:
                 summary.append(sentence)
                 current_length += len(sentence)
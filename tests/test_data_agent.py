@@ -0,0 +1,39 @@
+import os
+import sys
+
+from langchain_community.chat_models.fake import FakeListChatModel
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('OPENAI_API_KEY', 'sk-test')
+
+from agent.data_agent import DataAgent
+
+
+def make_agent(responses):
+    agent = DataAgent()
+    agent.llm = FakeListChatModel(responses=responses)
+    agent.agent = agent._create_agent()
+    return agent
+
+
+def test_repeated_question_skips_llm(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('a,b\n1,2\n3,4\n')
+    agent = make_agent(['Final Answer: 2', 'Final Answer: 3', 'Final Answer: 4'])
+
+    answers = [agent.analyze('What is the mean?', str(path), 'chat') for _ in range(3)]
+
+    assert answers == ['2', '2', '2']
+    assert agent.llm.i == 1
+    assert len(agent.cache._entries) == 1
+
+
+def test_cached_answer_is_scoped_to_chat(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('a,b\n1,2\n3,4\n')
+    agent = make_agent(['Final Answer: 2', 'Final Answer: 3', 'Final Answer: 4'])
+
+    agent.analyze('What is the mean?', str(path), 'first')
+
+    assert agent.analyze('what is the mean', str(path), 'second') == '3'
+    assert agent.llm.i == 2
@@ -0,0 +1,66 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.data_loader import DataLoader
+
+
+def test_preprocess_fills_integer_gaps_with_fractional_median(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('a,b\n1,x\n,y\n4,\n')
+
+    df = DataLoader.preprocess_data(DataLoader.load_data(str(path)))
+
+    assert df['a'].tolist() == [1.0, 2.5, 4.0]
+    assert df['b'].tolist() == ['x', 'y', 'x']
+
+
+def test_preprocess_widens_nullable_int_columns():
+    df = pd.DataFrame({'a': pd.array([1, None, 4], dtype='Int64')})
+
+    result = DataLoader.preprocess_data(df)
+
+    assert result['a'].tolist() == [1.0, 2.5, 4.0]
+    assert df['a'].isna().sum() == 1
+
+
+def test_preprocess_keeps_integer_dtype_for_integral_median():
+    df = pd.DataFrame({'a': pd.array([1, None, 3], dtype='Int64')})
+
+    result = DataLoader.preprocess_data(df)
+
+    assert result['a'].dtype == 'Int64'
+    assert result['a'].tolist() == [1, 2, 3]
+
+
+def test_preprocess_fills_arrow_date_and_bool_columns(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('d,flag,x\n2024-01-01,True,1\n,,2\n2024-01-01,False,3\n')
+    df = DataLoader.load_data(str(path))
+
+    result = DataLoader.preprocess_data(df)
+
+    assert DataLoader.get_data_info(df)['categorical_columns'] == ['d', 'flag']
+    assert result['d'].astype(str).tolist() == ['2024-01-01'] * 3
+    assert result['flag'].isna().sum() == 0
+
+
+def test_preprocess_keeps_integer_dtype_without_gaps():
+    df = pd.DataFrame({'a': pd.array([1, 2, 3, 4], dtype='Int64')})
+
+    result = DataLoader.preprocess_data(df)
+
+    assert result['a'].dtype == 'Int64'
+
+
+def test_preprocess_fills_under_copy_on_write(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text('a,b\n1,x\n,y\n4,\n')
+
+    with pd.option_context('mode.copy_on_write', True):
+        df = DataLoader.preprocess_data(DataLoader.load_data(str(path)))
+
+    assert df.isna().sum().sum() == 0